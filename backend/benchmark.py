@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Benchmark komponen pipeline upload DIGIDAWS (tanpa database dan tanpa Gemini).
+
+Pemakaian (dari folder backend):
+    python benchmark.py parser                       # corpus sintetis: parser toleran vs cascade lama
+    python benchmark.py parser --corpus responses/   # tambah corpus response Gemini asli (*.txt / *.json)
+    python benchmark.py parser --fuzz 5000 --seed 7  # fuzz: mutasi acak, gagal (exit 1) jika ada soal hilang
+    python benchmark.py scanner                      # modul 50 halaman: scanner satu pass vs re.search per pola
+    python benchmark.py scanner --pages 20 --skip-legacy
+    python benchmark.py docx                         # DOCX sintetis: streaming iterparse vs python-docx
+    python benchmark.py docx --file modul.docx       # DOCX asli; exit 1 jika teks kedua jalur berbeda
+    python benchmark.py gemini --jobs 4              # generate soal N job paralel lewat GeminiClient + fake_gemini
+    python benchmark.py gemini --jobs 8 --concurrency 4 --error-rate 0.1 --throttle-rate 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import google.generativeai as genai
+from docx import Document
+
+import app as app_module
+from app import (GEMINI_BREAKER_COOLDOWN_SECONDS, GEMINI_BREAKER_FAILURES, GEMINI_MODEL_NAME,
+                 IncrementalQuestionParser, MODULE_TEXT_SCANNER, QUESTIONS_PER_CELL, GeminiClient, GeminiLimiter,
+                 _read_docx_document_python_docx, _stream_docx_document, check_educational_content,
+                 extract_educational_components, extract_kurikulum_merdeka_components, generate_questions_by_cell,
+                 mst_question_cells, parse_questions_response, validate_kurikulum_merdeka_modul_ajar)
+from fake_gemini import start_in_background
+
+# =========================================
+# HELPER
+# =========================================
+def timed(func, *args, repeat=5):
+    """Jalankan func beberapa kali; return (hasil terakhir, median ms)."""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        durations.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(durations)
+
+def print_table(rows, headers):
+    widths = [max(len(str(row[i])) for row in rows + [headers]) for i in range(len(headers))]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+
+# =========================================
+# PARSER RESPONSE GEMINI
+# =========================================
+def sample_question(rng, i):
+    level = rng.randint(1, 5)
+    options = [f"Opsi {c} untuk soal {i} tentang penyimpanan {{cloud}}" for c in "ABCD"]
+    return {
+        "level": level,
+        "difficulty": rng.choice(["Easy", "Medium", "Hard"]),
+        "question_type": "multiple_choice",
+        "soal": f"Soal nomor {i}: fungsi utama \"CPU\" dalam sistem komputer adalah",
+        "options": options,
+        "jawaban_benar": rng.choice(options),
+        "taxonomy_indicator": "Mengingat dan mengenali istilah/perangkat dasar TIK",
+        "explanation": "CPU memproses instruksi dan data; path C:\\Windows hanya contoh. " * 2,
+        "modul_reference": "• Menjelaskan komponen dasar komputer"
+    }
+
+def legacy_cascade_parse(raw_text):
+    """Cascade parsing sebelum parser toleran (baseline benchmark): json.loads, pembersihan, regex, bracket matching."""
+    try:
+        return json.loads(raw_text)
+    except json.JSONDecodeError:
+        pass
+    cleaned_text = re.sub(r'```(?:json)?\s*\n?', '', raw_text.strip())
+    cleaned_text = re.sub(r'```\s*$', '', cleaned_text)
+    cleaned_text = re.sub(r',(\s*[}\]])', r'\1', cleaned_text)
+    cleaned_text = re.sub(r'//.*?\n', '\n', cleaned_text)
+    try:
+        return json.loads(cleaned_text)
+    except json.JSONDecodeError:
+        pass
+    match = re.search(r'\[\s*\{.*?\}\s*\]', raw_text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(re.sub(r',(\s*[}\]])', r'\1', match.group()))
+        except json.JSONDecodeError:
+            pass
+    start = raw_text.find('[')
+    depth = 0
+    for i in range(max(start, 0), len(raw_text)):
+        if raw_text[i] == '[':
+            depth += 1
+        elif raw_text[i] == ']':
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(re.sub(r',(\s*[}\]])', r'\1', raw_text[start:i + 1]))
+                except json.JSONDecodeError:
+                    break
+    # Emergency parser lama (regex DOTALL per pola)
+    pattern = r'"level"\s*:\s*(\d+).*?"soal"\s*:\s*"([^"]+)".*?"options"\s*:\s*\[(.*?)\].*?"jawaban_benar"\s*:\s*"([^"]+)'
+    return [{"level": int(m[0]), "soal": m[1]} for m in re.findall(pattern, raw_text, re.DOTALL | re.IGNORECASE)] or None
+
+def synthetic_corpus(rng, sizes=(5, 55, 500)):
+    """Response sintetis dengan kerusakan yang biasa muncul dari model."""
+    corpus = []
+    for size in sizes:
+        questions = [sample_question(rng, i) for i in range(size)]
+        valid = json.dumps(questions, indent=2, ensure_ascii=False)
+        corpus += [
+            (f"valid-{size}", valid, size),
+            (f"fence-{size}", f"Berikut soalnya:\n```json\n{valid}\n```\nSemoga membantu.", size),
+            (f"trailing-comma-{size}", valid.replace('"\n  }', '",\n  }').replace('}\n]', '},\n]'), size),
+            (f"comments-{size}", valid.replace('"level": ', '// soal baru\n    "level": '), size),
+            (f"truncated-{size}", valid[:-(len(valid) // (size * 3))], size),
+        ]
+    return corpus
+
+def load_corpus(folder):
+    corpus = []
+    for path in sorted(Path(folder).glob('*')):
+        if path.suffix in ('.txt', '.json'):
+            corpus.append((path.name, path.read_text(encoding='utf-8', errors='replace'), None))
+    return corpus
+
+def count_questions(result):
+    return len(result) if isinstance(result, list) else 0
+
+def bench_parser(args):
+    rng = random.Random(args.seed)
+    corpus = synthetic_corpus(rng)
+    if args.corpus:
+        corpus += load_corpus(args.corpus)
+
+    rows = []
+    for name, text, expected in corpus:
+        new_result, new_ms = timed(parse_questions_response, text, repeat=args.repeat)
+        old_result, old_ms = timed(legacy_cascade_parse, text, repeat=args.repeat)
+        rows.append((name, f"{len(text) // 1024} KB", expected if expected is not None else "-",
+                     count_questions(new_result), f"{new_ms:.1f}", count_questions(old_result), f"{old_ms:.1f}"))
+    print_table(rows, ("response", "ukuran", "soal", "toleran", "ms", "cascade lama", "ms"))
+
+    # Kasus patologis: objek tidak tertutup dengan banyak kurung (cascade lama bisa backtracking berat)
+    hostile = '[{"level": 1, "soal": "' + ('{ "x": [' * 2000) + 'a' * 100000
+    _, hostile_ms = timed(parse_questions_response, hostile, repeat=1)
+    _, legacy_ms = timed(legacy_cascade_parse, hostile, repeat=1)
+    print(f"\nInput rusak {len(hostile) // 1024} KB (tidak tertutup): parser toleran {hostile_ms:.1f} ms, "
+          f"cascade lama {legacy_ms:.1f} ms")
+
+    if args.fuzz:
+        return fuzz_parser(rng, args.fuzz)
+    return True
+
+def mutate(rng, text):
+    """Mutasi yang tidak menghilangkan data soal (semua soal harus tetap terbaca)."""
+    mutations = [
+        lambda t: f"```json\n{t}\n```",
+        lambda t: "Berikut hasilnya:\n" + t + "\nTerima kasih.",
+        lambda t: t.replace('",\n', '",  // catatan\n', 1),
+        lambda t: t.replace('",\n', '",,\n', 1),
+        lambda t: t.replace('\n  }', ',\n  }'),
+        lambda t: t.replace('"options"', '/* opsi */ "options"'),
+        lambda t: t.replace(': "', ':"').replace('\n', '\r\n'),
+    ]
+    for _ in range(rng.randint(1, 3)):
+        text = rng.choice(mutations)(text)
+    return text
+
+def fuzz_parser(rng, iterations):
+    failures = 0
+    truncated_recovered = 0
+    for i in range(iterations):
+        questions = [sample_question(rng, n) for n in range(rng.randint(1, 12))]
+        text = mutate(rng, json.dumps(questions, indent=2, ensure_ascii=False))
+
+        # 1) Mutasi tanpa kehilangan data: semua soal harus kembali persis
+        result = parse_questions_response(text) or []
+        if [q.get("soal") for q in result] != [q["soal"] for q in questions]:
+            failures += 1
+            if failures <= 5:
+                print(f"\n❌ Fuzz #{i}: {len(result)}/{len(questions)} soal\n{text[:400]}")
+
+        # 2) Streaming dengan potongan acak harus sama dengan parse utuh
+        parser = IncrementalQuestionParser()
+        streamed = []
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 64)
+            streamed += parser.feed(text[pos:pos + step])
+            pos += step
+        streamed += parser.finish()
+        if streamed != result:
+            failures += 1
+            if failures <= 5:
+                print(f"\n❌ Fuzz #{i}: hasil streaming berbeda dari parse utuh")
+
+        # 3) Terpotong di posisi acak: tidak boleh error, soal sebelum titik potong tetap terbaca
+        cut = rng.randint(0, len(text))
+        partial = parse_questions_response(text[:cut]) or []
+        complete_before_cut = text[:cut].count('"modul_reference"')
+        if len(partial) < complete_before_cut:
+            failures += 1
+            if failures <= 5:
+                print(f"\n❌ Fuzz #{i}: potong di {cut}, {len(partial)} < {complete_before_cut} soal lengkap")
+        truncated_recovered += len(partial) - complete_before_cut
+
+    print(f"\nFuzz {iterations} iterasi: {failures} kegagalan, "
+          f"{truncated_recovered} soal terpotong ikut dipulihkan sebagian")
+    return failures == 0
+
+# =========================================
+# SCANNER VALIDASI & EKSTRAKSI MODUL
+# =========================================
+# Pola re.search yang dijalankan validator/ekstraktor sebelum ada MODULE_TEXT_SCANNER (baseline benchmark):
+# (nama, flags, dicari di teks lowercase, pola). Setiap pola memindai seluruh dokumen sendiri-sendiri.
+LEGACY_MODULE_PATTERNS = (
+    ('validate', 0, True, (
+        r'modul\s+ajar', r'modul\s+pembelajaran', r'teaching\s+module', r'learning\s+module',
+        r'rpp\s+kurikulum\s+merdeka', r'rencana\s+pelaksanaan\s+pembelajaran', r'lesson\s+plan', r'rpp\s+merdeka',
+        r'kurikulum\s+merdeka', r'merdeka\s+belajar', r'perangkat\s+ajar', r'bahan\s+ajar', r'materi\s+pembelajaran',
+        r'desain\s+pembelajaran', r'mata\s+pelajaran\s*[:]\s*', r'subject\s*[:]\s*', r'fase\s*/?\s*kelas\s*[:]\s*',
+        r'phase\s*/?\s*class\s*[:]\s*', r'fase\s*[:]\s*[a-g]', r'kelas\s*[:]\s*[ivx\d]+', r'grade\s*[:]\s*\d+',
+        r'mapel\s*[:]\s*', r'pelajaran\s*[:]\s*', r'kelas\s+\d+', r'semester\s*[:]\s*', r'tingkat\s*[:]\s*',
+        r'jenjang\s*[:]\s*', r'sekolah\s+dasar', r'sekolah\s+menengah', r'smp|sma|smk|sd',
+        r'elementary|junior|senior|high\s+school', r'tujuan\s+pembelajaran', r'learning\s+objectives?',
+        r'capaian\s+pembelajaran', r'learning\s+outcomes?', r'i\.\s*tujuan\s+pembelajaran',
+        r'1\.\s*tujuan\s+pembelajaran', r'objektif\s+pembelajaran', r'target\s+pembelajaran',
+        r'sasaran\s+pembelajaran', r'kompetensi\s+dasar', r'indikator\s+pencapaian',
+        r'setelah\s+mengikuti\s+pembelajaran', r'siswa\s+mampu', r'peserta\s+didik\s+dapat',
+        r'akan\s+dapat\s+memahami', r'diharapkan\s+siswa', r'kompetensi\s+awal', r'prerequisite\s+competenc',
+        r'kemampuan\s+prasyarat', r'ii\.\s*kompetensi\s+awal', r'2\.\s*kompetensi\s+awal', r'kemampuan\s+dasar',
+        r'pengetahuan\s+awal', r'prasyarat\s+pembelajaran', r'kemampuan\s+prerequisit', r'bekal\s+awal',
+        r'pengetahuan\s+sebelumnya', r'sudah\s+dipelajari', r'telah\s+menguasai', r'kemampuan\s+yang\s+dimiliki',
+        r'pemahaman\s+bermakna', r'meaningful\s+understanding', r'essential\s+understanding',
+        r'iii\.\s*pemahaman\s+bermakna', r'3\.\s*pemahaman\s+bermakna', r'profil\s+pelajar\s+pancasila',
+        r'pancasila\s+student\s+profile', r'p5\s*[:]\s*', r'dimensi\s+profil\s+pelajar',
+        r'karakter\s+pelajar\s+pancasila', r'pertanyaan\s+pemantik', r'essential\s+questions?',
+        r'driving\s+questions?', r'guiding\s+questions?', r'iv\.\s*pertanyaan\s+pemantik',
+    )),
+    ('extract_km', re.IGNORECASE | re.DOTALL, False, (
+        r'mata\s+pelajaran\s*[:]\s*([^\n\r]+)', r'subject\s*[:]\s*([^\n\r]+)', r'modul\s+ajar\s*\n\s*([^\n\r]+)',
+        r'nama\s+modul\s*[:]\s*([^\n\r]+)', r'fase\s*/?\s*kelas\s*[:]\s*([^\n\r]+)',
+        r'fase\s*[:]\s*([a-g])\s*[\(/]*\s*kelas\s*([ivx\d\-]+)', r'kelas\s*[:]\s*([ivx\d\-\s]+)',
+        r'grade\s*[:]\s*(\d+)', r'phase\s*[:]\s*([a-g])',
+        r'ii\.\s*kompetensi\s+awal\s*[:\n](.*?)(?=\n\s*(?:iii\.|tujuan\s+pembelajaran|pemahaman\s+bermakna|$))',
+        r'kompetensi\s+awal\s*[:\n](.*?)(?=\n\s*(?:[ivx]+\.|tujuan\s+pembelajaran|pemahaman\s+bermakna|profil\s+pelajar|$))',
+        r'prerequisite\s+competenc[^\n]*[:\n](.*?)(?=\n\s*(?:learning\s+objective|meaningful\s+understanding|$))',
+        r'kemampuan\s+prasyarat\s*[:\n](.*?)(?=\n\s*(?:tujuan|pembelajaran|$))',
+        r'komponen\s+inti.*?i\.\s*tujuan\s+pembelajaran\s*[:\n](.*?)(?=\n\s*(?:ii\.|kompetensi\s+awal|pemahaman\s+bermakna|$))',
+        r'i\.\s*tujuan\s+pembelajaran\s*[:\n](.*?)(?=\n\s*(?:ii\.|kompetensi\s+awal|pemahaman\s+bermakna|$))',
+        r'tujuan\s+pembelajaran\s*[:\n](.*?)(?=\n\s*(?:kompetensi\s+awal|pemahaman\s+bermakna|pertanyaan\s+pemantik|profil\s+pelajar|ii\.|2\.|$))',
+        r'tujuan\s+pembelajaran[^\n]*\n((?:\s*[•\-\*\d\.]\s*[^\n]+\n?)+)',
+        r'(?:setelah\s+pembelajaran.*?|tujuan\s+pembelajaran.*?)(?:siswa\s+(?:dapat|mampu)|peserta\s+didik\s+(?:dapat|mampu))(.*?)(?=\n\s*(?:kompetensi\s+awal|pemahaman\s+bermakna|$))',
+        r'(?:capaian\s+pembelajaran|cp)(?:\s*[:\n]|\s+-\s*)(.*?)(?=\n\s*(?:pemahaman\s+bermakna|kompetensi\s+awal|indikator|tujuan\s+pembelajaran|profil\s+pelajar|pertanyaan\s+pemantik|[ivx]+\.|\d+\.|$))',
+        r'capaian\s+pembelajaran[^\n]*\n((?:\s*[•\-\*\d\.]+\s*[^\n]+\n?)+)',
+        r'(?:komponen\s+inti.*?)?(?:ii\.|2\.)\s*pemahaman\s+bermakna\s*[:\n](.*?)(?=\n\s*(?:iii\.|3\.|pertanyaan\s+pemantik|profil\s+pelajar|target\s+peserta|$))',
+        r'pemahaman\s+bermakna\s*[:\n](.*?)(?=\n\s*(?:pertanyaan\s+pemantik|profil\s+pelajar|target\s+peserta|iii\.|3\.|kegiatan\s+pembelajaran|$))',
+        r'meaningful\s+understanding\s*[:\n](.*?)(?=\n\s*(?:essential\s+question|student\s+profile|$))',
+        r'essential\s+understanding\s*[:\n](.*?)(?=\n\s*(?:question|profile|$))',
+        r'profil\s+pelajar\s+pancasila\s*[:\n](.*?)(?=\n\s*(?:pertanyaan\s+pemantik|kegiatan\s+pembelajaran|$))',
+        r'pancasila\s+student\s+profile\s*[:\n](.*?)(?=\n\s*(?:essential\s+question|learning\s+activities|$))',
+        r'dimensi\s+profil\s+pelajar\s*[:\n](.*?)(?=\n\s*(?:pemantik|kegiatan|$))',
+        r'p5\s*[:]\s*(.*?)(?=\n\s*(?:pemantik|kegiatan|$))',
+        r'pertanyaan\s+pemantik\s*[:\n](.*?)(?=\n\s*(?:kegiatan\s+pembelajaran|model\s+pembelajaran|$))',
+        r'essential\s+questions?\s*[:\n](.*?)(?=\n\s*(?:learning\s+activities|teaching\s+model|$))',
+        r'driving\s+questions?\s*[:\n](.*?)(?=\n\s*(?:activities|model|$))',
+        r'target\s+peserta\s+didik\s*[:\n](.*?)(?=\n\s*(?:model\s+pembelajaran|kegiatan\s+pembelajaran|$))',
+        r'sasaran\s+peserta\s+didik\s*[:\n](.*?)(?=\n\s*(?:model|kegiatan|$))',
+        r'v\.\s*target\s+peserta\s+didik\s*[:\n](.*?)(?=\n\s*(?:vi\.|6\.|$))',
+    )),
+    ('check_edu', 0, True, (
+        r'\b(modul|bab|materi|pembelajaran|pendidikan|pengajaran|pelatihan|belajar)\b',
+        r'\b(tujuan|capaian|sasaran|kompetensi|kemampuan)\s+(pembelajaran|belajar|pendidikan)\b',
+        r'\b(indikator|pencapaian|keberhasilan|penilaian)\s+(kompetensi|pembelajaran|belajar)\b',
+        r'\b(peserta\s+didik|siswa|murid|pelajar|mahasiswa)\b',
+        r'\b(pendahuluan|isi|penutup|daftar\s+pustaka|referensi|latihan|evaluasi|penilaian)\b',
+        r'\b(kelas|mata\s+pelajaran|mapel|bidang\s+studi|pelajaran|kurikulum|silabus)\b',
+        r'\b(diskusi|latihan|tugas|proyek|aktivitas|kegiatan|praktikum|eksperimen)\b',
+        r'\b(guru|pendidik|pengajar|fasilitator|instruktur|dosen|tutor)\b',
+    )),
+    ('extract_edu', re.DOTALL | re.IGNORECASE, True, (
+       
+        r'(?:modul|elemen|materi)(?:\s+ajar|\s+pembelajaran|\s+pokok)?(.*?)(?:kompetensi|tujuan|capaian|daftar pustaka|referensi)',
+        r'(?:bab|materi|konten|isi)(?:\s+pembelajaran|\s+utama)?(.*?)(?:kompetensi|tujuan|capaian|daftar pustaka|referensi)',
+        r'(?:pokok|inti)(?:\s+bahasan|\s+materi|\s+pembelajaran)?(.*?)(?:kompetensi|tujuan|capaian|daftar pustaka|referensi)',
+        r'(?:i\.|1\.)(?:\s+identitas\s+modul)(.*?)(?:ii\.|2\.)',
+        r'(?:kompetensi|kemampuan)(?:\s+awal|\s+dasar|\s+prasyarat)(?:\s+[\w\s]+)?[:\r\n](.*?)(?:tujuan|capaian|indikator|materi|bab|daftar pustaka|referensi)',
+        r'(?:prerequisite|prasyarat)(?:\s+[\w\s]+)?[:\r\n](.*?)(?:tujuan|capaian|indikator|materi|bab|daftar pustaka|referensi)',
+        r'(?:pengetahuan|keterampilan)(?:\s+awal|\s+dasar)(?:\s+[\w\s]+)?[:\r\n](.*?)(?:tujuan|capaian|indikator|materi|bab|daftar pustaka|referensi)',
+        r'(?:ii\.|2\.)(?:\s+kompetensi\s+awal)(.*?)(?:iii\.|3\.)',
+        r'(?:tujuan|capaian)(?:\s+pembelajaran|\s+belajar|\s+pendidikan|\s+instruksional|\s+pelatihan)(?:\s+[\w\s]+)?[:\r\n](.*?)(?:kompetensi|materi|bab|daftar pustaka|referensi|metodologi|pemahaman|target)',
+        r'(?:learning|instructional)(?:\s+objectives|\s+goals|\s+outcomes)(?:\s+[\w\s]+)?[:\r\n](.*?)(?:kompetensi|materi|bab|daftar pustaka|referensi|metodologi|pemahaman|target)',
+        r'(?:indikator|pencapaian)(?:\s+keberhasilan|\s+pembelajaran|\s+belajar)(?:\s+[\w\s]+)?[:\r\n](.*?)(?:kompetensi|materi|bab|daftar pustaka|referensi|metodologi|pemahaman|target)',
+        r'(?:iii\.|3\.)(?:\s+tujuan\s+pembelajaran)(.*?)(?:iv\.|4\.)',
+        r'(?:pemahaman\s+bermakna|bermakna\s+pemahaman|pemahaman\s+yang\s+bermakna)[:\r\n](.*?)(?:kompetensi|tujuan|capaian|materi|bab|daftar pustaka|referensi|target)',
+        r'(?:meaningful\s+understanding|understanding\s+meaningful)[:\r\n](.*?)(?:kompetensi|tujuan|capaian|materi|bab|daftar pustaka|referensi|target)',
+        r'(?:big\s+ideas|gagasan\s+utama|ide\s+pokok)[:\r\n](.*?)(?:kompetensi|tujuan|capaian|materi|bab|daftar pustaka|referensi|target)',
+        r'(?:iv\.|4\.)(?:\s+pemahaman\s+bermakna)(.*?)(?:v\.|5\.)',
+        r'(?:target\s+peserta\s+didik|sasaran\s+peserta|peserta\s+didik\s+target)[:\r\n](.*?)(?:kompetensi|tujuan|capaian|materi|bab|daftar pustaka|referensi)',
+        r'(?:target\s+audience|target\s+learners|intended\s+learners)[:\r\n](.*?)(?:kompetensi|tujuan|capaian|materi|bab|daftar pustaka|referensi)',
+        r'(?:siswa\s+yang\s+dituju|karakteristik\s+peserta\s+didik)[:\r\n](.*?)(?:kompetensi|tujuan|capaian|materi|bab|daftar pustaka|referensi)',
+        r'(?:v\.|5\.)(?:\s+target\s+peserta\s+didik)(.*?)(?:vi\.|6\.)',
+    )),
+)
+
+MODULE_TOPICS = ["algoritma", "struktur data", "jaringan komputer", "basis data", "pemrograman web", "keamanan data"]
+MODULE_SENTENCES = [
+    "Pada kegiatan ini {who} mengamati contoh {topic} yang ada di sekitar sekolah",
+    "Guru menjelaskan langkah-langkah {topic} menggunakan media presentasi dan lembar kerja",
+    "{who} berdiskusi dalam kelompok kecil lalu mempresentasikan hasil analisis {topic}",
+    "Setiap kelompok menuliskan kesimpulan tentang {topic} pada papan tulis",
+    "Penilaian formatif dilakukan melalui kuis singkat dan observasi keaktifan {who}",
+    "Bahan bacaan tambahan tersedia di perpustakaan digital sekolah",
+]
+
+def synthetic_module(rng, pages):
+    """Modul Ajar sintetis ~2.500 karakter per halaman dengan struktur Kurikulum Merdeka."""
+    topic = rng.choice(MODULE_TOPICS)
+    parts = [
+        "MODUL AJAR KURIKULUM MERDEKA\nINFORMATIKA\n\nINFORMASI UMUM\nA. IDENTITAS MODUL\n",
+        f"Nama Penyusun : Guru Informatika\nMata Pelajaran : Informatika\nFase / Kelas : D / VIII\nTopik : {topic}\n",
+        "B. KOMPETENSI AWAL\nSiswa telah mengenal perangkat komputer dan dapat mengetik dokumen sederhana.\n",
+        "C. PROFIL PELAJAR PANCASILA\nBernalar kritis dalam menganalisis masalah sehari-hari\n"
+        "Gotong royong dalam menyelesaikan tugas kelompok\n\n",
+        "KOMPONEN INTI\nA. Tujuan Pembelajaran\n",
+        f"1. Siswa dapat menjelaskan konsep dasar {topic} dengan bahasa sendiri.\n",
+        f"2. Siswa mampu menerapkan {topic} untuk menyelesaikan studi kasus sederhana.\n",
+        "B. Pemahaman Bermakna\n• Berpikir komputasional membantu menyelesaikan masalah secara sistematis.\n\n",
+        "C. Pertanyaan Pemantik\n1. Bagaimana komputer membantu pekerjaan kita?\n2. Mengapa data perlu diolah?\n",
+        "D. Kegiatan Pembelajaran\n",
+    ]
+    size = 0
+    for page in range(pages):
+        page_text = [f"Pertemuan {page + 1}\n"]
+        while size < (page + 1) * 2500:
+            sentence = rng.choice(MODULE_SENTENCES).format(who=rng.choice(["siswa", "peserta didik"]),
+                                                           topic=rng.choice(MODULE_TOPICS))
+            page_text.append(sentence + (".\n" if rng.random() < 0.3 else ". "))
+            size += len(sentence) + 2
+        parts.append("".join(page_text) + "\n")
+    parts.append("E. Asesmen\nTes tertulis dan unjuk kerja.\n\nDAFTAR PUSTAKA\nKemendikbudristek. 2022. Informatika.\n")
+    return "".join(parts)
+
+def module_variants(rng, pages):
+    text = synthetic_module(rng, pages)
+    return [
+        ("normal", text),
+        # Bagian inti tidak ada: pola lama dengan (.*?) memindai sampai akhir dokumen lalu gagal
+        ("tanpa-bagian", re.sub(r"(?i)tujuan|kompetensi|pemahaman|capaian|daftar", "uraian", text)),
+        # Hasil PyPDF2 sering tanpa baris baru sama sekali
+        ("pdf-satu-baris", text.replace("\n", " ")),
+    ]
+
+def run_module_scanner(text):
+    app_module._last_text_index = None  # paksa scan baru (tanpa cache get_text_index)
+    with contextlib.redirect_stdout(io.StringIO()):
+        validate_kurikulum_merdeka_modul_ajar(text)
+        extract_kurikulum_merdeka_components(text)
+        check_educational_content(text)
+        extract_educational_components(text, return_dict=True)
+
+def run_legacy_patterns(text):
+    lowered = text.lower()
+    for _, flags, use_lower, patterns in LEGACY_MODULE_PATTERNS:
+        for pattern in patterns:
+            re.search(pattern, lowered if use_lower else text, flags)
+
+def bench_scanner(args):
+    rng = random.Random(args.seed)
+    rows = []
+    for name, text in module_variants(rng, args.pages):
+        scan_index, scan_ms = timed(MODULE_TEXT_SCANNER.index, text, repeat=args.repeat)
+        _, full_ms = timed(run_module_scanner, text, repeat=args.repeat)
+        legacy_ms = "-"
+        if not args.skip_legacy:
+            # Pola lama bisa backtracking berat: cukup sekali jalan
+            _, legacy = timed(run_legacy_patterns, text, repeat=1)
+            legacy_ms = f"{legacy:.1f}"
+        hit_count = sum(len(scan_index.spans(spec)) for spec in MODULE_TEXT_SCANNER.spec_variants)
+        rows.append((name, f"{len(text) // 1024} KB", hit_count, f"{scan_ms:.1f}", f"{full_ms:.1f}", legacy_ms))
+    total_patterns = sum(len(patterns) for _, _, _, patterns in LEGACY_MODULE_PATTERNS)
+    print(f"Modul {args.pages} halaman, {len(MODULE_TEXT_SCANNER.spec_variants)} penanda dalam satu scanner "
+          f"vs {total_patterns} pola re.search lama\n")
+    print_table(rows, ("dokumen", "ukuran", "hit", "scan ms", "validasi+ekstraksi ms", "pola lama ms"))
+    return True
+
+# =========================================
+# EKSTRAKSI DOCX
+# =========================================
+def synthetic_docx(rng, pages):
+    """DOCX dari modul sintetis: judul bagian sebagai Heading, tabel identitas, dan header halaman."""
+    doc = Document()
+    doc.core_properties.title = "Modul Ajar Informatika"
+    doc.sections[0].header.paragraphs[0].text = "Modul Ajar Kurikulum Merdeka"
+    table = doc.add_table(rows=0, cols=2)
+    for label in ("Nama Penyusun", "Mata Pelajaran", "Fase / Kelas", "Alokasi Waktu"):
+        cells = table.add_row().cells
+        cells[0].text, cells[1].text = label, rng.choice(MODULE_TOPICS)
+    for line in synthetic_module(rng, pages).splitlines():
+        if not line.strip():
+            continue
+        if line.isupper() or re.match(r"^[A-E]\. ", line):
+            doc.add_heading(line, level=1 if line.isupper() else 2)
+        else:
+            doc.add_paragraph(line)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def measure_docx(reader, file_bytes, repeat):
+    """(teks, median ms, peak memori KB tracemalloc)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        document, elapsed_ms = timed(reader, file_bytes, repeat=repeat)
+        tracemalloc.start()
+        reader(file_bytes)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return document.text, elapsed_ms, peak // 1024
+
+def bench_docx(args):
+    rng = random.Random(args.seed)
+    documents = [(f"sintetis {pages} hal", synthetic_docx(rng, pages)) for pages in args.pages]
+    documents += [(Path(name).name, Path(name).read_bytes()) for name in args.file or []]
+    rows = []
+    identical = True
+    for name, file_bytes in documents:
+        stream_text, stream_ms, stream_kb = measure_docx(_stream_docx_document, file_bytes, args.repeat)
+        docx_text, docx_ms, docx_kb = measure_docx(lambda data: _read_docx_document_python_docx(data, 'docx'),
+                                                   file_bytes, args.repeat)
+        same = stream_text == docx_text
+        identical = identical and same
+        rows.append((name, f"{len(file_bytes) // 1024} KB", f"{stream_ms:.1f}", f"{docx_ms:.1f}",
+                     f"{docx_ms / stream_ms:.1f}x", stream_kb, docx_kb, "ya" if same else "TIDAK"))
+    print_table(rows, ("dokumen", "ukuran", "streaming ms", "python-docx ms", "speedup",
+                       "streaming peak KB", "python-docx peak KB", "teks identik"))
+    print("\nPeak memori dari tracemalloc (objek Python); tree lxml milik python-docx tidak ikut terhitung.")
+    return identical
+
+# =========================================
+# GEMINI CLIENT (fake_gemini, tanpa jaringan)
+# =========================================
+BENCH_MODULE_COMPONENTS = {
+    "mata_pelajaran": "Informatika",
+    "topik_utama": "Pengenalan Aplikasi Perkantoran",
+    "kelas": "X",
+    "tujuan_pembelajaran": ["Menjelaskan fungsi dasar aplikasi pengolah kata",
+                            "Menerapkan format teks dasar pada dokumen"],
+    "pemahaman_bermakna": ["Aplikasi perkantoran membantu menyusun dokumen dengan rapi"],
+}
+
+def bench_gemini(args):
+    """N job upload paralel menjalankan generate_questions_by_cell terhadap server Gemini palsu lewat
+    GeminiClient dengan limiter baru; exit 1 jika ada job yang soalnya kurang."""
+    server, endpoint = start_in_background(port=0, latency=args.latency, chunk_delay=args.chunk_delay,
+                                           error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                                           seed=args.seed)
+    genai.configure(api_key=app_module.my_api_key_gemini, transport='rest', client_options={'api_endpoint': endpoint})
+    app_module.model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+    limiter_path = Path(tempfile.mkdtemp(prefix='gemini_bench_')) / 'gemini_limiter.sqlite3'
+    app_module.GEMINI_CLIENT = GeminiClient(
+        GeminiLimiter(str(limiter_path), args.concurrency, args.rpm, args.burst, GEMINI_BREAKER_FAILURES,
+                      GEMINI_BREAKER_COOLDOWN_SECONDS, 1),
+        backoff=args.backoff)
+
+    target = len(mst_question_cells()) * QUESTIONS_PER_CELL
+    results = {}
+
+    def run_job(guru_id):
+        started = time.perf_counter()
+        questions, stats = generate_questions_by_cell(BENCH_MODULE_COMPONENTS, guru_id=guru_id)
+        results[guru_id] = (len(questions), stats, (time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        threads = [threading.Thread(target=run_job, args=(guru_id,)) for guru_id in range(1, args.jobs + 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    usage = {row["guru_id"]: row for row in app_module.GEMINI_CLIENT.limiter.usage()}
+    rows = []
+    for guru_id in sorted(results):
+        count, stats, elapsed_ms = results[guru_id]
+        row = usage.get(guru_id, {})
+        rows.append((guru_id, f"{count}/{target}", stats["requests"], stats["failed_requests"], row.get("retries", 0),
+                     stats["first_question_ms"], f"{elapsed_ms:.0f}", row.get("avg_latency_ms"),
+                     row.get("prompt_tokens"), row.get("response_tokens")))
+    print_table(rows, ("guru", "soal", "request", "gagal", "retry", "soal pertama ms", "durasi ms",
+                       "latency rata2 ms", "token prompt", "token response"))
+    server_stats = server.state.stats
+    print(f"\nTotal {wall_ms:.0f} ms untuk {args.jobs} job; server: {server_stats['requests']} request, "
+          f"konkurensi maks {server_stats['max_active']} (batas {args.concurrency}), "
+          f"{server_stats['throttled']}x 429, {server_stats['errors']}x 503")
+    server.shutdown()
+    return all(count >= target for count, _, _ in results.values())
+
+# =========================================
+# MAIN
+# =========================================
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark komponen pipeline upload DIGIDAWS")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_cmd = subparsers.add_parser("parser", help="Parser response Gemini (toleran vs cascade lama)")
+    parser_cmd.add_argument("--corpus", help="Folder berisi response Gemini asli (*.txt / *.json)")
+    parser_cmd.add_argument("--fuzz", type=int, default=0, help="Jumlah iterasi fuzz")
+    parser_cmd.add_argument("--seed", type=int, default=42, help="Seed random")
+    parser_cmd.add_argument("--repeat", type=int, default=5, help="Pengulangan per response (median)")
+    parser_cmd.set_defaults(func=bench_parser)
+
+    scanner_cmd = subparsers.add_parser("scanner", help="Scanner validasi/ekstraksi modul (satu pass vs per pola)")
+    scanner_cmd.add_argument("--pages", type=int, default=50, help="Jumlah halaman modul sintetis")
+    scanner_cmd.add_argument("--seed", type=int, default=42, help="Seed random")
+    scanner_cmd.add_argument("--repeat", type=int, default=5, help="Pengulangan per dokumen (median)")
+    scanner_cmd.add_argument("--skip-legacy", action="store_true", help="Jangan jalankan pola re.search lama")
+    scanner_cmd.set_defaults(func=bench_scanner)
+
+    docx_cmd = subparsers.add_parser("docx", help="Ekstraksi DOCX (streaming iterparse vs python-docx)")
+    docx_cmd.add_argument("--pages", type=int, nargs="+", default=[5, 50], help="Ukuran modul sintetis (halaman)")
+    docx_cmd.add_argument("--file", action="append", help="File DOCX asli (boleh diulang)")
+    docx_cmd.add_argument("--seed", type=int, default=42, help="Seed random")
+    docx_cmd.add_argument("--repeat", type=int, default=5, help="Pengulangan per dokumen (median)")
+    docx_cmd.set_defaults(func=bench_docx)
+
+    gemini_cmd = subparsers.add_parser("gemini", help="Generate soal lewat GeminiClient terhadap fake_gemini")
+    gemini_cmd.add_argument("--jobs", type=int, default=4, help="Jumlah job upload paralel")
+    gemini_cmd.add_argument("--concurrency", type=int, default=8, help="Batas panggilan Gemini bersamaan")
+    gemini_cmd.add_argument("--rpm", type=int, default=0, help="Laju token bucket per menit (0 = tanpa batas)")
+    gemini_cmd.add_argument("--burst", type=int, default=10, help="Kapasitas token bucket")
+    gemini_cmd.add_argument("--backoff", type=float, default=0.2, help="Backoff awal retry (detik)")
+    gemini_cmd.add_argument("--latency", type=float, default=0.5, help="Latency fake server sebelum byte pertama")
+    gemini_cmd.add_argument("--chunk-delay", type=float, default=0.02, help="Jeda antar potongan stream (detik)")
+    gemini_cmd.add_argument("--error-rate", type=float, default=0.0, help="Peluang 503 per request")
+    gemini_cmd.add_argument("--throttle-rate", type=float, default=0.0, help="Peluang 429 per request")
+    gemini_cmd.add_argument("--seed", type=int, default=42, help="Seed random")
+    gemini_cmd.set_defaults(func=bench_gemini)
+
+    args = parser.parse_args()
+    if not args.func(args):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 """
 Script untuk membuat tabel progress_tracker di database production.
 Jalankan script ini di VPS untuk menambahkan tabel baru.
+Hanya diperlukan jika progress disimpan di MySQL (PROGRESS_STORE=database);
+backend default (sqlite) tidak memakai tabel ini.
 """
 
 import sys
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Server Gemini palsu untuk menjalankan dan mem-benchmark DIGIDAWS secara offline.
+
+Meniru REST API Gemini (POST /v1beta/models/<model>:generateContent dan :streamGenerateContent)
+sejauh yang dipakai google-generativeai dengan transport REST. Prompt generate soal per sel MST
+dijawab dengan JSON array soal valid untuk level/difficulty yang diminta; prompt lain (tips,
+rekomendasi) dijawab dengan beberapa kalimat pendek. Latency, jeda antar potongan stream, dan
+error 429/503 dapat diatur untuk menguji retry, token bucket, dan circuit breaker GeminiClient.
+GET /stats mengembalikan jumlah request dan konkurensi maksimum yang pernah terlihat.
+
+Pemakaian (dari folder backend):
+    python fake_gemini.py                                  # http://127.0.0.1:8765
+    python fake_gemini.py --latency 0.8 --chunk-delay 0.05 --error-rate 0.1 --throttle-rate 0.05
+
+    # Aplikasi / load test memakai server ini lewat GEMINI_API_ENDPOINT:
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8765 python app.py
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8765 python loadtest.py -n 100 -c 50
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Sama dengan DIFFICULTY_LEVELS di app.py; dipakai bila prompt soal tidak menyebut satu sel
+MST_CELLS = {
+    1: ["Medium"],
+    2: ["Easy", "Hard"],
+    3: ["Medium", "Hard"],
+    4: ["Easy", "Medium", "Hard"],
+    5: ["Easy", "Medium", "Hard"]
+}
+CELL_TARGET = re.compile(r'TARGET:\s*(\d+)\s+soal.*?Level\s+(\d)\b.*?difficulty\s+"(\w+)"', re.S)
+DEVICES = ["flash disk", "cloud storage", "router", "printer", "webcam", "browser", "spreadsheet",
+           "email", "antivirus", "sistem operasi", "kartu memori", "proyektor"]
+TEXT_SENTENCES = [
+    "Coba buat ringkasan materi ini dengan kata-katamu sendiri supaya konsepnya lebih melekat.",
+    "Latih lagi soal serupa dan tulis alasan kenapa jawaban yang benar itu tepat.",
+    "Bandingkan dua konsep yang sering tertukar dalam tabel kecil agar perbedaannya jelas.",
+    "Diskusikan bagian yang masih membingungkan dengan teman atau guru minggu ini."
+]
+
+# =========================================
+# RESPONSE PALSU
+# =========================================
+class FakeGeminiState:
+    """Pengaturan dan statistik server (dibagi semua thread handler)."""
+
+    def __init__(self, latency=0.5, chunk_delay=0.02, chunk_chars=400, error_rate=0.0,
+                 throttle_rate=0.0, seed=1):
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.chunk_chars = chunk_chars
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rng = random.Random(seed)
+        self.serial = itertools.count(1)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "streamed": 0, "errors": 0, "throttled": 0, "active": 0, "max_active": 0}
+
+    def roll(self):
+        """Tentukan nasib satu request: None (sukses), 429, atau 503."""
+        with self.lock:
+            value = self.rng.random()
+        if value < self.throttle_rate:
+            return 429
+        if value < self.throttle_rate + self.error_rate:
+            return 503
+        return None
+
+    def count(self, key, delta=1):
+        with self.lock:
+            self.stats[key] += delta
+            if key == "active":
+                self.stats["max_active"] = max(self.stats["max_active"], self.stats["active"])
+
+    def question(self, level, difficulty):
+        number = next(self.serial)
+        with self.lock:
+            device = self.rng.choice(DEVICES)
+            answer = self.rng.randrange(4)
+        options = [f"Pilihan {chr(65 + i)} untuk {device} nomor {number}" for i in range(4)]
+        return {
+            "level": level,
+            "difficulty": difficulty,
+            "question_type": "multiple_choice",
+            "soal": f"Soal latihan {number} level {level} {difficulty}: fungsi utama {device} adalah",
+            "options": options,
+            "jawaban_benar": options[answer],
+            "taxonomy_indicator": "Mengingat dan mengenali istilah/perangkat dasar TIK",
+            "explanation": f"Penjelasan singkat tentang {device} untuk soal nomor {number}.",
+            "modul_reference": "• Menjelaskan fungsi perangkat teknologi informasi"
+        }
+
+    def reply_text(self, prompt):
+        if 'jawaban_benar' not in prompt:
+            return "\n".join(TEXT_SENTENCES)
+        target = CELL_TARGET.search(prompt)
+        if target:
+            count, level, difficulty = int(target.group(1)), int(target.group(2)), target.group(3)
+            questions = [self.question(level, difficulty) for _ in range(count)]
+        else:
+            questions = [self.question(level, difficulty)
+                         for level, difficulties in MST_CELLS.items() for difficulty in difficulties
+                         for _ in range(5)]
+        return json.dumps(questions, ensure_ascii=False, indent=2)
+
+
+def response_payload(text, prompt_chars=0, final=True, response_chars=None):
+    """Satu GenerateContentResponse; finishReason dan usageMetadata (kumulatif) hanya di potongan terakhir."""
+    candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+    payload = {"candidates": [candidate]}
+    if final:
+        candidate["finishReason"] = "STOP"
+        prompt_tokens = prompt_chars // 4
+        response_tokens = (len(text) if response_chars is None else response_chars) // 4
+        payload["usageMetadata"] = {"promptTokenCount": prompt_tokens, "candidatesTokenCount": response_tokens,
+                                    "totalTokenCount": prompt_tokens + response_tokens}
+    return payload
+
+# =========================================
+# HTTP HANDLER
+# =========================================
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/stats':
+            with self.state.lock:
+                stats = dict(self.state.stats)
+            self._send_json(200, stats)
+            return
+        self._send_json(404, {"error": {"code": 404, "message": "Not found", "status": "NOT_FOUND"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        method = self.path.split('?', 1)[0].rsplit(':', 1)[-1]
+        if method not in ('generateContent', 'streamGenerateContent'):
+            self._send_json(404, {"error": {"code": 404, "message": "Not found", "status": "NOT_FOUND"}})
+            return
+        try:
+            request = json.loads(body or b'{}')
+            prompt = "".join(part.get("text", "") for content in request.get("contents", [])
+                             for part in content.get("parts", []))
+        except (ValueError, AttributeError):
+            self._send_json(400, {"error": {"code": 400, "message": "Invalid JSON", "status": "INVALID_ARGUMENT"}})
+            return
+
+        state = self.state
+        state.count("requests")
+        state.count("active")
+        try:
+            time.sleep(state.latency)
+            failure = state.roll()
+            if failure == 429:
+                state.count("throttled")
+                self._send_json(429, {"error": {"code": 429, "message": "Resource has been exhausted",
+                                                "status": "RESOURCE_EXHAUSTED"}})
+                return
+            if failure == 503:
+                state.count("errors")
+                self._send_json(503, {"error": {"code": 503, "message": "The model is overloaded",
+                                                "status": "UNAVAILABLE"}})
+                return
+
+            text = state.reply_text(prompt)
+            if method == 'generateContent':
+                self._send_json(200, response_payload(text, len(prompt)))
+                return
+
+            # Streaming REST: satu JSON array yang dikirim bertahap (chunked), satu elemen per potongan
+            state.count("streamed")
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=UTF-8')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            pieces = [text[i:i + state.chunk_chars] for i in range(0, len(text), state.chunk_chars)] or [""]
+            for index, piece in enumerate(pieces):
+                final = index == len(pieces) - 1
+                element = json.dumps(response_payload(piece, len(prompt), final, len(text)), ensure_ascii=False)
+                self._write_chunk((("[" if index == 0 else ",") + element + ("]" if final else "")).encode('utf-8'))
+                if not final:
+                    time.sleep(state.chunk_delay)
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client berhenti membaca (timeout / deadline)
+        finally:
+            state.count("active", -1)
+
+
+def create_server(host='127.0.0.1', port=8765, **options):
+    """Buat server (belum berjalan); port=0 memilih port bebas. Pengaturan di server.state."""
+    server = ThreadingHTTPServer((host, port), FakeGeminiHandler)
+    server.daemon_threads = True
+    server.state = FakeGeminiState(**options)
+    return server
+
+
+def start_in_background(**options):
+    """Jalankan server di thread daemon; return (server, endpoint) untuk GEMINI_API_ENDPOINT."""
+    server = create_server(**options)
+    threading.Thread(target=server.serve_forever, name='fake-gemini', daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server Gemini palsu (REST) untuk benchmark offline DIGIDAWS")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.5, help="Detik sebelum byte pertama response")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="Detik antar potongan stream")
+    parser.add_argument("--chunk-chars", type=int, default=400, help="Ukuran potongan stream (karakter)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Peluang response 503 per request")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Peluang response 429 per request")
+    parser.add_argument("--seed", type=int, default=1, help="Seed random agar skenario dapat diulang")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, latency=args.latency, chunk_delay=args.chunk_delay,
+                           chunk_chars=args.chunk_chars, error_rate=args.error_rate,
+                           throttle_rate=args.throttle_rate, seed=args.seed)
+    print(f"Fake Gemini berjalan di http://{args.host}:{server.server_address[1]} "
+          f"(latency {args.latency}s, error {args.error_rate:.0%}, 429 {args.throttle_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Load test ujian kelas DIGIDAWS (alur MST siswa).
+
+Harness membuat N siswa sintetis + satu koleksi soal tervalidasi di database load test,
+mendaftarkan siswa lewat endpoint add_students_by_class, lalu menjalankan
+/login -> /api/mst/start -> /get_question -> /submit_answer secara paralel.
+Laporan berisi latency p50/p95/p99, query DB per request (header X-DB-Queries)
+dan error rate per endpoint.
+
+Database load test terpisah (default mysql+pymysql://root:@localhost/digidaws_loadtest,
+ubah via DATABASE_URL). Gemini diganti FakeGeminiModel sehingga tidak ada panggilan API; bila
+GEMINI_API_ENDPOINT di-set (mis. ke fake_gemini.py), panggilan lewat GeminiClient dan SDK asli.
+
+Pemakaian (dari folder backend):
+    python loadtest.py -n 40                          # in-process (Flask test client)
+    python loadtest.py -n 200 -c 50 --ramp-up 10 --json hasil_loadtest.json
+    python loadtest.py --race 20                      # 20 submit paralel soal yang sama, exit 1 bila race
+
+    # Terhadap gunicorn (DATABASE_URL server & harness harus sama):
+    DATABASE_URL=mysql+pymysql://root:@localhost/digidaws_loadtest DIGIDAWS_QUERY_COUNT=1 SQLALCHEMY_ECHO=0 \\
+        gunicorn -w 4 -b 127.0.0.1:8000 loadtest:application
+    python loadtest.py -n 200 -c 50 --target http://127.0.0.1:8000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from pathlib import Path
+from urllib import error as urlerror
+from urllib import parse as urlparse
+from urllib import request as urlrequest
+
+LOADTEST_DATABASE_URL = 'mysql+pymysql://root:@localhost/digidaws_loadtest'
+LOADTEST_PASSWORD = 'loadtest123'
+LOADTEST_GURU_EMAIL = 'guru@loadtest.local'
+
+# Harus di-set sebelum app di-import (konfigurasi dibaca saat import)
+os.environ.setdefault('DATABASE_URL', LOADTEST_DATABASE_URL)
+os.environ.setdefault('DIGIDAWS_QUERY_COUNT', '1')
+os.environ.setdefault('SQLALCHEMY_ECHO', '0')
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from werkzeug.security import generate_password_hash
+
+import app as digidaws
+from app import (app, db, CollectionQuestion, Guru, MST_ENGINE, MSTState, Question,
+                 QuestionCollection, Siswa, SiswaAnswer, SiswaResult, collection_students,
+                 invalidate_item_bank)
+
+# =========================================
+# FAKE GEMINI
+# =========================================
+class FakeGeminiResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeGeminiModel:
+    """Pengganti genai.GenerativeModel: balasan kosong dengan latency tetap, tanpa jaringan."""
+
+    def __init__(self, latency=0.05, text='[]'):
+        self.latency = latency
+        self.text = text
+
+    def generate_content(self, *args, **kwargs):
+        time.sleep(self.latency)
+        if kwargs.get('stream'):
+            return iter([FakeGeminiResponse(self.text)])
+        return FakeGeminiResponse(self.text)
+
+if not os.getenv('GEMINI_API_ENDPOINT'):
+    digidaws.model = FakeGeminiModel()
+
+# Entry point WSGI untuk gunicorn: gunicorn -w 4 loadtest:application
+application = app
+
+# =========================================
+# DATA SINTETIS
+# =========================================
+def ensure_loadtest_database(allow_any_db=False):
+    database = db.engine.url.database or ''
+    if not allow_any_db and 'loadtest' not in database:
+        raise SystemExit(f"❌ Database '{database}' bukan database load test. "
+                         f"Set DATABASE_URL ke database *loadtest* atau pakai --allow-any-db.")
+    db.create_all()
+
+def seed_run(n_students, items_per_module):
+    """Buat guru, koleksi dengan soal tervalidasi untuk semua modul MST, dan N siswa satu kelas."""
+    run_id = time.strftime('%Y%m%d%H%M%S')
+    kelas = f'LT-{run_id}'
+    password_hash = generate_password_hash(LOADTEST_PASSWORD)
+
+    guru = Guru.query.filter_by(email=LOADTEST_GURU_EMAIL).first()
+    if not guru:
+        guru = Guru(username=LOADTEST_GURU_EMAIL, email=LOADTEST_GURU_EMAIL, nama='Guru Load Test',
+                    password_hash=password_hash, has_seen_welcome_guide=True)
+        db.session.add(guru)
+        db.session.flush()
+
+    collection = QuestionCollection(guru_id=guru.id, name=f'Load Test {run_id}',
+                                    description='Koleksi sintetis untuk load test')
+    db.session.add(collection)
+    db.session.flush()
+
+    questions = []
+    for stage, difficulty in sorted(MST_ENGINE.modules):
+        for i in range(items_per_module):
+            questions.append(Question(
+                guru_id=guru.id, level=stage, technology_level=stage, difficulty=difficulty,
+                soal=f'[Load test] Soal L{stage} {difficulty} #{i + 1}',
+                jawaban_benar='A', options=json.dumps(['A', 'B', 'C', 'D']),
+                question_type='multiple_choice', bobot_soal=1, is_validated=True
+            ))
+    db.session.add_all(questions)
+    db.session.flush()
+    db.session.add_all([CollectionQuestion(collection_id=collection.id, question_id=q.id) for q in questions])
+
+    students = [Siswa(username=f'lt-{run_id}-{i}@loadtest.local', email=f'lt-{run_id}-{i}@loadtest.local',
+                      nama=f'Siswa LT {i + 1}', kelas=kelas, password_hash=password_hash)
+                for i in range(n_students)]
+    db.session.add_all(students)
+    db.session.commit()
+    invalidate_item_bank(collection.id)
+
+    print(f"✅ Data sintetis: koleksi {collection.id}, {len(questions)} soal, {len(students)} siswa kelas {kelas}")
+    return {
+        'run_id': run_id,
+        'kelas': kelas,
+        'collection_id': collection.id,
+        'question_ids': [q.id for q in questions],
+        'students': [(s.id, s.email) for s in students]
+    }
+
+def cleanup_run(run):
+    siswa_ids = [sid for sid, _ in run['students']]
+    cid = run['collection_id']
+    for model in (SiswaAnswer, SiswaResult, MSTState):
+        model.query.filter(model.siswa_id.in_(siswa_ids)).delete(synchronize_session=False)
+    db.session.execute(collection_students.delete().where(collection_students.c.collection_id == cid))
+    Siswa.query.filter(Siswa.id.in_(siswa_ids)).delete(synchronize_session=False)
+    CollectionQuestion.query.filter_by(collection_id=cid).delete(synchronize_session=False)
+    Question.query.filter(Question.id.in_(run['question_ids'])).delete(synchronize_session=False)
+    QuestionCollection.query.filter_by(id=cid).delete(synchronize_session=False)
+    db.session.commit()
+    invalidate_item_bank(cid)
+    print(f"🧹 Data load test {run['run_id']} dihapus")
+
+# =========================================
+# CLIENT (in-process / HTTP)
+# =========================================
+class LocalClient:
+    """Flask test client; satu instance per siswa agar cookie sesi terpisah."""
+
+    def __init__(self):
+        self.client = app.test_client()
+
+    def request(self, method, path, json_body=None, form=None):
+        response = self.client.open(path, method=method, json=json_body, data=form)
+        return response.status_code, response.get_json(silent=True), response.headers
+
+class _NoRedirect(urlrequest.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+class HttpClient:
+    """Client HTTP ke server yang berjalan (gunicorn), dengan cookie jar sendiri."""
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.opener = urlrequest.build_opener(urlrequest.HTTPCookieProcessor(CookieJar()), _NoRedirect())
+
+    def request(self, method, path, json_body=None, form=None):
+        data, headers = None, {}
+        if json_body is not None:
+            data = json.dumps(json_body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        elif form is not None:
+            data = urlparse.urlencode(form).encode('utf-8')
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        req = urlrequest.Request(self.base_url + path, data=data, headers=headers, method=method)
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                status, body, headers = response.status, response.read(), response.headers
+        except urlerror.HTTPError as e:
+            # Redirect (302/303) juga sampai di sini karena _NoRedirect tidak mengikutinya
+            status, body, headers = e.code, e.read(), e.headers
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            payload = None
+        return status, payload, headers
+
+# =========================================
+# PENGUKURAN
+# =========================================
+class LoadStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}  # endpoint -> list[(latency_ms, ok, queries)]
+
+    def call(self, endpoint, client, method, path, ok, json_body=None, form=None):
+        """Kirim satu request dan catat latency-nya. ok(status, body, headers) menentukan sukses.
+        Returns: (status, body, sukses)
+        """
+        started = time.perf_counter()
+        try:
+            status, body, headers = client.request(method, path, json_body=json_body, form=form)
+            queries = headers.get('X-DB-Queries')
+            success = bool(ok(status, body or {}, headers))
+        except Exception as e:
+            print(f"[LoadTest] {endpoint} gagal: {e}")
+            status, body, queries, success = 0, None, None, False
+        latency = (time.perf_counter() - started) * 1000
+        with self.lock:
+            self.samples.setdefault(endpoint, []).append(
+                (latency, success, int(queries) if queries is not None else -1))
+        return status, body, success
+
+    def report(self):
+        endpoints = {}
+        for endpoint, samples in self.samples.items():
+            latency = np.array([s[0] for s in samples])
+            errors = sum(1 for s in samples if not s[1])
+            queries = np.array([s[2] for s in samples if s[2] >= 0])
+            endpoints[endpoint] = {
+                'requests': len(samples),
+                'errors': errors,
+                'error_rate': round(errors / len(samples), 4),
+                'p50_ms': round(float(np.percentile(latency, 50)), 1),
+                'p95_ms': round(float(np.percentile(latency, 95)), 1),
+                'p99_ms': round(float(np.percentile(latency, 99)), 1),
+                'queries_mean': round(float(queries.mean()), 2) if len(queries) else None,
+                'queries_max': int(queries.max()) if len(queries) else None
+            }
+        return endpoints
+
+def _is_success(status, body, headers=None):
+    return status == 200 and body.get('success') is not False and body.get('status') != 'error'
+
+def _is_login_success(status, body, headers):
+    """/login selalu redirect; kredensial salah redirect kembali ke /login, bukan ke dashboard."""
+    location = headers.get('Location') or ''
+    return status in (302, 303) and bool(location) and urlparse.urlsplit(location).path.rstrip('/') != '/login'
+
+# =========================================
+# SKENARIO
+# =========================================
+def assign_students(client_factory, stats, run):
+    guru = client_factory()
+    _, _, logged_in = stats.call('login', guru, 'POST', '/login', _is_login_success,
+                                 form={'email': LOADTEST_GURU_EMAIL, 'password': LOADTEST_PASSWORD})
+    if not logged_in:
+        raise SystemExit(f"❌ Login guru {LOADTEST_GURU_EMAIL} gagal")
+    status, body, _ = stats.call('add_students_by_class', guru, 'POST',
+                              f"/api/collections/{run['collection_id']}/add_students_by_class",
+                              _is_success, json_body={'class_name': run['kelas']})
+    if not (body or {}).get('success'):
+        raise SystemExit(f"❌ add_students_by_class gagal (HTTP {status}): {(body or {}).get('message')}")
+
+def run_student(client_factory, stats, collection_id, student, p_correct, think_time, rng):
+    """Satu siswa mengerjakan tes MST sampai selesai. Returns: jumlah soal dijawab"""
+    siswa_id, email = student
+    client = client_factory()
+    _, _, logged_in = stats.call('login', client, 'POST', '/login', _is_login_success,
+                                 form={'email': email, 'password': LOADTEST_PASSWORD})
+    if not logged_in:
+        return 0  # jangan lanjut dengan sesi anonim; login gagal tercatat sebagai error
+    stats.call('/api/mst/start', client, 'POST', f'/api/mst/start/{collection_id}', _is_success, json_body={})
+
+    question_path = f'/get_question?user_id={siswa_id}&collection_id={collection_id}'
+    _, question, _ = stats.call('/get_question', client, 'GET', question_path, _is_success)
+
+    answered = 0
+    while question and question.get('status') == 'continue' and question.get('id') and answered < 50:
+        if think_time:
+            time.sleep(rng.uniform(0, think_time))
+        answer = question.get('jawaban_benar') if rng.random() < p_correct else 'X'
+        _, result, _ = stats.call('/submit_answer', client, 'POST', '/submit_answer', _is_success, json_body={
+            'user_id': siswa_id,
+            'question_id': question['id'],
+            'answer': answer or 'X',
+            'collection_id': collection_id
+        })
+        answered += 1
+        if not result or result.get('status') != 'continue':
+            break
+        question = result.get('next_question')
+        if not question:
+            _, question, _ = stats.call('/get_question', client, 'GET', question_path, _is_success)
+    return answered
+
+def run_load_test(run, client_factory, concurrency, ramp_up, p_correct, think_time, seed):
+    stats = LoadStats()
+    assign_students(client_factory, stats, run)
+
+    students = run['students']
+    started = time.perf_counter()
+
+    def worker(index):
+        if ramp_up:
+            time.sleep(ramp_up * index / max(len(students), 1))
+        rng = random.Random(seed * 100003 + index)
+        return run_student(client_factory, stats, run['collection_id'], students[index],
+                           p_correct, think_time, rng)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        answered = list(pool.map(worker, range(len(students))))
+    elapsed = time.perf_counter() - started
+
+    total_requests = sum(len(samples) for samples in stats.samples.values())
+    return {
+        'students': len(students),
+        'concurrency': concurrency,
+        'elapsed_s': round(elapsed, 2),
+        'throughput_rps': round(total_requests / elapsed, 1) if elapsed else None,
+        'answers_per_test': round(sum(answered) / len(answered), 2) if answered else 0,
+        'endpoints': stats.report()
+    }
+
+def run_race(run, client_factory, parallel):
+    """Uji race submit_answer: `parallel` request paralel untuk siswa/koleksi/soal yang sama.
+
+    Soal pertama dikirim serentak sebelum MST state ada (race pembuatan state), soal terakhir
+    modul stage 1 dikirim serentak untuk memicu transisi stage. Invariant dicek langsung di DB.
+    Returns: (laporan, daftar pelanggaran)
+    """
+    stats = LoadStats()
+    assign_students(client_factory, stats, run)
+    siswa_id, email = run['students'][0]
+    collection_id = run['collection_id']
+
+    module_size = MST_ENGINE.item_count(1, 'Medium')
+    with app.app_context():
+        stage1_ids = [q.id for q in Question.query.filter(Question.id.in_(run['question_ids']),
+                                                          Question.technology_level == 1)
+                      .order_by(Question.id)]
+        db.session.remove()
+    if len(stage1_ids) < module_size:
+        raise SystemExit(f"❌ Modul stage 1 butuh {module_size} soal; naikkan --items-per-module")
+    stage1_ids = stage1_ids[:module_size]
+
+    clients = [client_factory() for _ in range(parallel)]
+    for client in clients:
+        _, _, logged_in = stats.call('login', client, 'POST', '/login', _is_login_success,
+                                     form={'email': email, 'password': LOADTEST_PASSWORD})
+        if not logged_in:
+            raise SystemExit(f"❌ Login siswa {email} gagal")
+
+    def submit(client, question_id):
+        return stats.call('/submit_answer', client, 'POST', '/submit_answer', _is_success, json_body={
+            'user_id': siswa_id, 'question_id': question_id, 'answer': 'A', 'collection_id': collection_id
+        })
+
+    def burst(question_id):
+        barrier = threading.Barrier(parallel)
+
+        def fire(client):
+            barrier.wait()
+            return submit(client, question_id)
+
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            return list(pool.map(fire, clients))
+
+    def mst_snapshot():
+        with app.app_context():
+            states = MSTState.query.filter_by(siswa_id=siswa_id, collection_id=collection_id).all()
+            answers = [row.question_id for row in SiswaAnswer.query.filter_by(
+                siswa_id=siswa_id, collection_id=collection_id)]
+            snapshot = {
+                'state_rows': len(states),
+                'stage': states[0].current_stage if states else None,
+                'questions_answered': states[0].questions_answered if states else None,
+                'answers': answers
+            }
+            db.session.remove()
+        return snapshot
+
+    violations = []
+
+    def check_burst(label, results):
+        failed = [status for status, body, _ in results if status != 200 or (body or {}).get('status') == 'error']
+        accepted = [body for status, body, _ in results if status == 200 and body and not body.get('duplicate')
+                    and body.get('status') != 'error']
+        if failed:
+            violations.append(f"{label}: {len(failed)} request gagal (HTTP {sorted(set(failed))})")
+        if len(accepted) != 1:
+            violations.append(f"{label}: {len(accepted)} jawaban diterima, seharusnya 1")
+
+    first_results = burst(stage1_ids[0])
+    check_burst(f"Soal pertama ({parallel} paralel, tanpa state)", first_results)
+    if module_size > 1:
+        snapshot = mst_snapshot()
+        if snapshot['state_rows'] != 1 or snapshot['questions_answered'] != 1:
+            violations.append(f"Setelah soal pertama: {snapshot['state_rows']} baris state, "
+                              f"questions_answered={snapshot['questions_answered']} (seharusnya 1 dan 1)")
+        for question_id in stage1_ids[1:-1]:
+            submit(clients[0], question_id)
+        check_burst(f"Soal terakhir modul ({parallel} paralel)", burst(stage1_ids[-1]))
+
+    snapshot = mst_snapshot()
+    if snapshot['state_rows'] != 1:
+        violations.append(f"{snapshot['state_rows']} baris mst_state, seharusnya 1")
+    if snapshot['stage'] != 2:
+        violations.append(f"Stage akhir {snapshot['stage']}, seharusnya 2 (tepat satu transisi)")
+    if snapshot['questions_answered'] != 0:
+        violations.append(f"questions_answered={snapshot['questions_answered']} setelah transisi, seharusnya 0")
+    if sorted(snapshot['answers']) != sorted(stage1_ids):
+        violations.append(f"Jawaban tersimpan {sorted(snapshot['answers'])}, seharusnya {sorted(stage1_ids)}")
+
+    report = {
+        'parallel': parallel,
+        'module_size': module_size,
+        'final_state': snapshot,
+        'endpoints': stats.report()
+    }
+    return report, violations
+
+def print_report(report):
+    print(f"\n=== Load test: {report['students']} siswa, concurrency {report['concurrency']}, "
+          f"{report['elapsed_s']} s, {report['throughput_rps']} req/s ===")
+    print(f"Rata-rata soal per tes: {report['answers_per_test']}\n")
+    print(f"{'Endpoint':<24}{'Req':>6}{'Err%':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'Q/req':>8}")
+    for endpoint, item in report['endpoints'].items():
+        queries = '-' if item['queries_mean'] is None else item['queries_mean']
+        print(f"{endpoint:<24}{item['requests']:>6}{item['error_rate'] * 100:>6.1f}%"
+              f"{item['p50_ms']:>9}{item['p95_ms']:>9}{item['p99_ms']:>9}{queries:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test ujian kelas DIGIDAWS (alur MST)")
+    parser.add_argument("-n", "--students", type=int, default=40, help="Jumlah siswa sintetis")
+    parser.add_argument("-c", "--concurrency", type=int, help="Jumlah siswa paralel (default = semua)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Sebar waktu mulai siswa dalam N detik")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Jeda acak maks (detik) sebelum menjawab")
+    parser.add_argument("--p-correct", type=float, default=0.6, help="Peluang siswa menjawab benar")
+    parser.add_argument("--items-per-module", type=int, default=3, help="Jumlah soal tervalidasi per modul MST")
+    parser.add_argument("--seed", type=int, default=1, help="Seed random agar skenario dapat diulang")
+    parser.add_argument("--target", help="URL server (mis. gunicorn http://127.0.0.1:8000); default in-process")
+    parser.add_argument("--keep-data", action="store_true", help="Jangan hapus data sintetis setelah selesai")
+    parser.add_argument("--allow-any-db", action="store_true", help="Izinkan database yang namanya tanpa 'loadtest'")
+    parser.add_argument("--json", help="Simpan laporan ke file JSON")
+    parser.add_argument("--race", type=int, metavar="N",
+                        help="Uji race: N submit_answer paralel untuk soal yang sama (satu siswa); exit 1 bila gagal")
+    args = parser.parse_args()
+
+    if args.target:
+        client_factory = lambda: HttpClient(args.target)
+    else:
+        client_factory = LocalClient
+
+    with app.app_context():
+        ensure_loadtest_database(args.allow_any_db)
+        run = seed_run(1 if args.race else args.students, args.items_per_module)
+        db.session.remove()
+
+    try:
+        if args.race:
+            report, violations = run_race(run, client_factory, args.race)
+            report['target'] = args.target or 'in-process'
+            print(f"\n=== Race submit_answer: {args.race} paralel, modul {report['module_size']} soal ===")
+            print(f"State akhir: {report['final_state']}")
+            for violation in violations:
+                print(f"❌ {violation}")
+            if args.json:
+                with open(args.json, "w", encoding="utf-8") as f:
+                    json.dump(dict(report, violations=violations), f, indent=2)
+            if violations:
+                raise SystemExit(1)
+            print("✅ Tidak ada race: satu baris state, satu transisi stage, counter konsisten")
+            return
+        report = run_load_test(run, client_factory, args.concurrency or args.students,
+                               args.ramp_up, args.p_correct, args.think_time, args.seed)
+        report['target'] = args.target or 'in-process'
+        print_report(report)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nLaporan disimpan ke {args.json}")
+    finally:
+        if not args.keep_data:
+            with app.app_context():
+                cleanup_run(run)
+
+if __name__ == "__main__":
+    main()
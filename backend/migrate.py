@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Migrasi skema database DIGIDAWS berbasis versi.
+
+Setiap migrasi punya nomor versi dan dicatat di tabel `schema_migrations`,
+sehingga script ini aman dijalankan berulang kali saat deploy (idempotent).
+Index hot-path dideklarasikan di model (`__table_args__` / `index=True`) di app.py;
+migrasi di sini hanya menambahkan yang belum ada pada database lama.
+
+Pemakaian (dari folder backend):
+    python migrate.py                 # terapkan migrasi yang belum jalan
+    python migrate.py --status        # tampilkan status migrasi
+    python migrate.py --explain       # laporan EXPLAIN sebelum & sesudah migrasi
+    python migrate.py --explain --report explain_report.txt
+"""
+
+import argparse
+import datetime
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from app import (app, db, CollectionQuestion, Question, Siswa,
+                 SiswaAnswer, SiswaResult)
+
+# =========================================
+# HELPER
+# =========================================
+def index_exists(table_name, index_name):
+    return bool(db.session.execute(text(
+        "SELECT COUNT(*) FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND INDEX_NAME = :index_name"
+    ), {"table_name": table_name, "index_name": index_name}).scalar())
+
+def ensure_declared_indexes(model):
+    """Buat index yang dideklarasikan pada model tetapi belum ada di database."""
+    table = model.__table__
+    for index in sorted(table.indexes, key=lambda i: i.name):
+        if index_exists(table.name, index.name):
+            print(f"✓ Index {index.name} already exists in {table.name}")
+            continue
+        index.create(bind=db.session.connection())
+        print(f"✅ Added index {index.name} to {table.name}")
+
+# =========================================
+# DAFTAR MIGRASI (urut berdasarkan versi, jangan ubah migrasi yang sudah rilis)
+# =========================================
+def migration_0001_mst_state_unique_key():
+    # Hapus baris ganda lama, pertahankan state terbaru
+    db.session.execute(text("""
+        DELETE older FROM mst_state older
+        JOIN mst_state newer
+          ON newer.siswa_id = older.siswa_id
+         AND newer.collection_id = older.collection_id
+         AND newer.id > older.id
+    """))
+    if not index_exists('mst_state', 'uq_mst_state_siswa_collection'):
+        db.session.execute(text(
+            "ALTER TABLE mst_state ADD UNIQUE KEY uq_mst_state_siswa_collection (siswa_id, collection_id)"
+        ))
+        print("✅ Added unique key uq_mst_state_siswa_collection to mst_state")
+
+def migration_0002_hot_path_indexes():
+    for model in (SiswaAnswer, CollectionQuestion, Question, SiswaResult, Siswa):
+        ensure_declared_indexes(model)
+
+def migration_0003_mst_state_module_question_ids():
+    exists = db.session.execute(text(
+        "SELECT COUNT(*) FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'mst_state' AND COLUMN_NAME = 'module_question_ids'"
+    )).scalar()
+    if not exists:
+        db.session.execute(text(
+            "ALTER TABLE mst_state ADD COLUMN module_question_ids VARCHAR(255) DEFAULT '' "
+            "COMMENT 'ID soal yang sudah dijawab di modul aktif'"
+        ))
+        print("✅ Added column module_question_ids to mst_state")
+
+MIGRATIONS = [
+    (1, 'mst_state unique (siswa_id, collection_id)', migration_0001_mst_state_unique_key),
+    (2, 'hot-path composite indexes', migration_0002_hot_path_indexes),
+    (3, 'mst_state.module_question_ids untuk modul multi-soal', migration_0003_mst_state_module_question_ids),
+]
+
+def ensure_migrations_table():
+    db.session.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            applied_at DATETIME NOT NULL
+        )
+    """))
+    db.session.commit()
+
+def applied_versions():
+    rows = db.session.execute(text("SELECT version FROM schema_migrations")).fetchall()
+    return {row[0] for row in rows}
+
+def upgrade():
+    """Terapkan semua migrasi yang belum tercatat di schema_migrations."""
+    ensure_migrations_table()
+    done = applied_versions()
+    pending = [m for m in MIGRATIONS if m[0] not in done]
+    if not pending:
+        print("✓ Skema sudah versi terbaru")
+        return True
+
+    for version, name, apply in pending:
+        print(f"\n🔧 Migrasi {version:04d}: {name}")
+        try:
+            apply()
+            db.session.execute(text(
+                "INSERT INTO schema_migrations (version, name, applied_at) VALUES (:version, :name, :applied_at)"
+            ), {"version": version, "name": name, "applied_at": datetime.datetime.now()})
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Migrasi {version:04d} gagal: {e}")
+            return False
+    print("\n✅ Semua migrasi berhasil diterapkan")
+    return True
+
+def print_status():
+    ensure_migrations_table()
+    done = applied_versions()
+    for version, name, _ in MIGRATIONS:
+        print(f"[{'x' if version in done else ' '}] {version:04d} {name}")
+
+# =========================================
+# LAPORAN EXPLAIN
+# =========================================
+# Query utama per endpoint (bentuk sama dengan yang dibuat ORM di app.py)
+EXPLAIN_QUERIES = [
+    ("/get_question (item bank)", """
+        SELECT questions.id FROM questions
+        JOIN collection_questions ON collection_questions.question_id = questions.id
+        WHERE collection_questions.collection_id = :collection_id AND questions.is_validated = 1
+    """),
+    ("/get_question (validation matrix)", """
+        SELECT questions.technology_level, questions.difficulty, COUNT(DISTINCT questions.id) FROM questions
+        JOIN collection_questions ON collection_questions.question_id = questions.id
+        WHERE collection_questions.collection_id = :collection_id AND questions.is_validated = 1
+        GROUP BY questions.technology_level, questions.difficulty
+    """),
+    # Cek submit ganda memakai module_question_ids di baris mst_state (tanpa query ke siswa_answers)
+    ("/submit_answer (mst_state lookup)", """
+        SELECT id FROM mst_state WHERE siswa_id = :siswa_id AND collection_id = :collection_id
+    """),
+    ("/submit_answer (mst_state lock)", """
+        SELECT * FROM mst_state WHERE siswa_id = :siswa_id AND collection_id = :collection_id FOR UPDATE
+    """),
+    ("/submit_answer (siswa_results)", """
+        UPDATE siswa_results SET current_level = current_level
+        WHERE siswa_id = :siswa_id AND collection_id = :collection_id
+    """),
+    ("/api/siswa/results (score)", """
+        SELECT COUNT(*) FROM siswa_answers
+        WHERE siswa_id = :siswa_id AND collection_id = :collection_id AND is_correct = 1
+    """),
+    ("/api/questions/in_collection", """
+        SELECT collection_id FROM collection_questions WHERE collection_id = :collection_id AND question_id = :question_id
+    """),
+    ("add_students_by_class", """
+        SELECT id FROM siswa WHERE kelas = :kelas
+    """),
+]
+
+def sample_params():
+    """Ambil ID contoh dari database agar rencana query realistis."""
+    def first(sql):
+        return db.session.execute(text(sql)).scalar()
+    return {
+        "collection_id": first("SELECT MIN(collection_id) FROM collection_questions") or 1,
+        "question_id": first("SELECT MIN(question_id) FROM collection_questions") or 1,
+        "siswa_id": first("SELECT MIN(id) FROM siswa") or 1,
+        "kelas": first("SELECT kelas FROM siswa WHERE kelas IS NOT NULL LIMIT 1") or "",
+    }
+
+def explain_report(title):
+    params = sample_params()
+    lines = [f"=== EXPLAIN: {title} ({datetime.datetime.now():%Y-%m-%d %H:%M:%S}) ==="]
+    for endpoint, sql in EXPLAIN_QUERIES:
+        lines.append(f"\n{endpoint}")
+        try:
+            result = db.session.execute(text("EXPLAIN " + sql), params)
+            columns = list(result.keys())
+            for row in result.fetchall():
+                row = dict(zip(columns, row))
+                lines.append(
+                    f"  table={row.get('table')} type={row.get('type')} key={row.get('key')} "
+                    f"rows={row.get('rows')} extra={row.get('Extra')}"
+                )
+        except Exception as e:
+            lines.append(f"  (gagal: {e})")
+        db.session.rollback()
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrasi skema database DIGIDAWS")
+    parser.add_argument("--status", action="store_true", help="Tampilkan status migrasi saja")
+    parser.add_argument("--explain", action="store_true", help="Cetak laporan EXPLAIN sebelum dan sesudah migrasi")
+    parser.add_argument("--report", help="Simpan laporan EXPLAIN ke file")
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.status:
+            print_status()
+            return
+
+        reports = []
+        if args.explain:
+            reports.append(explain_report("sebelum migrasi"))
+        success = upgrade()
+        if args.explain:
+            reports.append(explain_report("sesudah migrasi"))
+            report_text = "\n\n".join(reports)
+            print("\n" + report_text)
+            if args.report:
+                with open(args.report, "w", encoding="utf-8") as f:
+                    f.write(report_text + "\n")
+                print(f"\nLaporan disimpan ke {args.report}")
+        if not success:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
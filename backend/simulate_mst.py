@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Simulasi MST DIGIDAWS untuk studi routing, exposure soal, dan perencanaan kapasitas.
+
+Examinee sintetis (theta ~ Normal) dijalankan melalui MST_ROUTING memakai pool soal
+tervalidasi koleksi yang sebenarnya. Hasil sama dengan endpoint
+/api/collections/<id>/mst-simulation.
+
+Pemakaian (dari folder backend):
+    python simulate_mst.py 12                       # 1000 examinee, theta ~ N(0, 1)
+    python simulate_mst.py 12 -n 5000 --seed 7
+    python simulate_mst.py 12 --theta-mean -0.5 --json hasil_simulasi.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app import app, QuestionCollection, simulate_mst
+
+def print_report(report):
+    print(f"\n=== Simulasi MST koleksi {report['collection_id']} "
+          f"({report['examinees']} examinee, {report['elapsed_ms']} ms) ===")
+    print(f"Akurasi diagnosis : {report['diagnosis_accuracy'] * 100:.1f}%")
+    print(f"Tes tidak lengkap : {report['incomplete_rate'] * 100:.1f}%")
+    print(f"Soal per tes      : rata-rata {report['items_per_test']['mean']}, maks {report['items_per_test']['max']}")
+
+    print("\nDistribusi diagnosis:")
+    for label, count in report['diagnosis_distribution'].items():
+        print(f"  {label:<18} {count}")
+
+    print("\nJalur terbanyak:")
+    for item in report['path_distribution'][:10]:
+        print(f"  {item['rate'] * 100:5.1f}%  {item['path']}")
+
+    exposure = report['item_exposure']
+    print(f"\nExposure soal: {exposure['items_in_pool']} soal di pool, {exposure['unused_items']} tidak pernah muncul, "
+          f"maks {exposure['max_rate'] * 100:.1f}%, rata-rata {exposure['mean_rate'] * 100:.1f}%")
+    for item in exposure['top_items'][:5]:
+        print(f"  #{item['question_id']:<6} L{item['technology_level']} {item['difficulty']:<6} {item['exposure_rate'] * 100:.1f}%")
+
+    calls = report['db_calls_per_test']
+    print("\nPerkiraan DB call per tes:")
+    print(f"  mode per soal : rata-rata {calls['item_mode_mean']}, p95 {calls['item_mode_p95']} "
+          f"(total {calls['item_mode_total']})")
+    print(f"  mode panel    : {calls['panel_mode']} (total {calls['panel_mode_total']})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi MST untuk satu koleksi soal")
+    parser.add_argument("collection_id", type=int, help="ID koleksi soal")
+    parser.add_argument("-n", "--examinees", type=int, default=1000, help="Jumlah examinee sintetis")
+    parser.add_argument("--theta-mean", type=float, default=0.0, help="Rata-rata kemampuan (theta)")
+    parser.add_argument("--theta-sd", type=float, default=1.0, help="Simpangan baku kemampuan (theta)")
+    parser.add_argument("--seed", type=int, help="Seed random agar hasil dapat diulang")
+    parser.add_argument("--json", help="Simpan laporan lengkap ke file JSON")
+    args = parser.parse_args()
+
+    with app.app_context():
+        if not QuestionCollection.query.get(args.collection_id):
+            print(f"❌ Koleksi {args.collection_id} tidak ditemukan")
+            sys.exit(1)
+
+        report = simulate_mst(args.collection_id, args.examinees, args.theta_mean, args.theta_sd, args.seed)
+        print_report(report)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            print(f"\nLaporan disimpan ke {args.json}")
+
+if __name__ == "__main__":
+    main()
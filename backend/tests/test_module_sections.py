@@ -0,0 +1,55 @@
+"""
+Extractor komponen per bagian (ModuleDocument.sections) dibandingkan dengan extractor lama
+extract_educational_components. Jalankan dari folder backend: python -m pytest -q tests
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add the backend folder to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import ModuleDocument, extract_educational_components, extract_sectioned_components
+
+OBJECTIVES = [
+    "Siswa mampu menjelaskan proses fotosintesis.",
+    "Asesmen formatif berupa kuis singkat",
+    "Siswa mampu merancang percobaan cahaya.",
+]
+OBJECTIVES_TEXT = "Tujuan Pembelajaran:\n" + "\n".join(OBJECTIVES) + "\n"
+
+
+def test_body_line_with_section_word_is_not_a_heading():
+    text = OBJECTIVES_TEXT + "Refleksi siswa dicatat di jurnal\n"
+    titles = [heading.title for heading in ModuleDocument.from_text(text).headings]
+    assert titles == ["tujuan pembelajaran"]
+
+
+def test_numbered_or_bare_section_name_is_a_heading():
+    text = OBJECTIVES_TEXT + "2. Asesmen\nKuis pilihan ganda.\nRefleksi\nJurnal harian.\n"
+    sections = ModuleDocument.from_text(text).sections()
+    assert list(sections) == ["tujuan pembelajaran", "asesmen", "refleksi"]
+    assert sections["asesmen"] == "Kuis pilihan ganda."
+
+
+def test_sectioned_objectives_match_old_extractor():
+    old = "\n".join(extract_educational_components(OBJECTIVES_TEXT, return_dict=True).values())
+    new = extract_sectioned_components(ModuleDocument.from_text(OBJECTIVES_TEXT))["Tujuan Pembelajaran"]
+    for objective in OBJECTIVES:
+        assert objective in old
+        assert objective in new
+
+
+def test_styled_heading_blocks_survive_cache_round_trip():
+    document = ModuleDocument()
+    document.add('heading', 'Tujuan Pembelajaran', 'Heading 1')
+    for objective in OBJECTIVES:
+        document.add('paragraph', objective)
+    document.add('heading', 'Asesmen', 'Heading 2')
+    document.add('paragraph', 'Kuis pilihan ganda.')
+
+    cached = ModuleDocument.from_blocks(json.loads(json.dumps(document.blocks)))
+    assert cached.text == document.text
+    assert cached.sections() == document.sections()
+    assert document.sections()["tujuan pembelajaran"] == "\n".join(OBJECTIVES)
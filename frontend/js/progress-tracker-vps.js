@@ -3,6 +3,7 @@
  * Compatible dengan multiple Gunicorn workers
  * 
  * Features:
+ * - Push progress via Server-Sent Events (/api/progress/<id>/stream), polling hanya fallback
  * - Auto-stop polling ketika tidak ada progress aktif
  * - Error handling yang robust
  * - Cleanup otomatis untuk mencegah memory leaks
@@ -14,6 +15,8 @@ class ProgressTracker {
         this.userId = userId;
         this.progressContainer = progressContainer;
         this.pollingInterval = null;
+        this.eventSource = null;
+        this.streamErrors = 0;
         this.isActive = false;
         this.retryCount = 0;
         this.maxRetries = options.maxRetries || 10;
@@ -41,11 +44,12 @@ class ProgressTracker {
         
         console.log(`Starting progress polling for user ${this.userId}`);
         
-        // Start immediate poll
-        this.pollProgress();
-        
-        // Set up interval polling
-        this.pollingInterval = setInterval(this.pollProgress, this.pollIntervalMs);
+        // Utamakan SSE; polling interval hanya jika browser tidak mendukung EventSource
+        if (window.EventSource) {
+            this.startStream();
+        } else {
+            this.startIntervalPolling();
+        }
         
         // Set timeout to auto-stop polling
         setTimeout(() => {
@@ -56,6 +60,49 @@ class ProgressTracker {
         }, this.timeoutMs);
     }
 
+    startStream() {
+        this.streamErrors = 0;
+        this.eventSource = new EventSource(`/api/progress/${this.userId}/stream`);
+        
+        this.eventSource.addEventListener('progress', (event) => {
+            this.streamErrors = 0;
+            const progress = JSON.parse(event.data);
+            if (progress) {
+                this.updateProgressUI(progress);
+            }
+        });
+        
+        this.eventSource.addEventListener('done', () => {
+            console.log('Progress stream finished, stopping');
+            this.stopPolling();
+        });
+        
+        // EventSource reconnect otomatis; beralih ke polling jika stream terus gagal
+        this.eventSource.onerror = () => {
+            this.streamErrors++;
+            if (this.streamErrors >= this.maxRetries) {
+                console.warn('Progress stream unavailable, falling back to polling');
+                this.closeStream();
+                this.startIntervalPolling();
+            }
+        };
+    }
+
+    closeStream() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+    }
+
+    startIntervalPolling() {
+        // Start immediate poll
+        this.pollProgress();
+        
+        // Set up interval polling
+        this.pollingInterval = setInterval(this.pollProgress, this.pollIntervalMs);
+    }
+
     async pollProgress() {
         if (!this.isActive) return;
 
@@ -174,6 +221,7 @@ class ProgressTracker {
         if (!this.isActive) return;
 
         this.isActive = false;
+        this.closeStream();
         
         if (this.pollingInterval) {
             clearInterval(this.pollingInterval);